@@ -1,12 +1,32 @@
 # alerting_system_complete.py
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from abc import ABC, abstractmethod
+import asyncio
+import functools
+import heapq
+import itertools
+import os
+import queue
+import threading
 from enum import Enum
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field, asdict, is_dataclass
 from typing import List, Set, Optional, Dict
 import json
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# Hot paths compare epoch microseconds (plain ints) instead of datetime
+# objects; _INT64_MAX stands in for "no expiry".
+_INT64_MAX = (1 << 63) - 1
+
+def _as_us(dt: datetime) -> int:
+    return int(dt.timestamp() * 1_000_000)
+
 # ===== ENUMS & DATA MODELS =====
 class Severity(Enum):
     INFO = "info"
@@ -28,20 +48,20 @@ class NotificationStatus(Enum):
     READ = "read"
     SNOOZED = "snoozed"
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: str
     name: str
     email: str
     team_id: str
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     id: str
     name: str
     member_ids: Set[str]
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     id: str
     title: str
@@ -55,18 +75,37 @@ class Alert:
     reminder_frequency: timedelta = timedelta(hours=2)
     status: AlertStatus = AlertStatus.ACTIVE
     reminders_enabled: bool = True
+    # Resolved target-user cache, managed by AlertManager._resolve_targets().
+    # _visibility_version is bumped whenever visibility_config changes so the
+    # cache is rebuilt lazily on the next lookup.
+    _visibility_version: int = field(default=0, init=False, repr=False)
+    _target_users_cache: Optional[Set[str]] = field(default=None, init=False, repr=False)
+    _cached_visibility_version: int = field(default=-1, init=False, repr=False)
+    _cached_repo_version: int = field(default=-1, init=False, repr=False)
+    # Epoch-microsecond mirrors of the datetime fields, kept in sync by
+    # _sync_times() so activity/frequency checks are integer compares.
+    _start_us: int = field(default=0, init=False, repr=False)
+    _expiry_us: int = field(default=_INT64_MAX, init=False, repr=False)
+    _frequency_us: int = field(default=0, init=False, repr=False)
 
-    def is_active(self) -> bool:
-        now = datetime.now()
-        if self.status != AlertStatus.ACTIVE:
-            return False
-        if now < self.start_time:
-            return False
-        if self.expiry_time and now > self.expiry_time:
-            return False
-        return True
+    def __post_init__(self):
+        self._sync_times()
 
-@dataclass
+    def _sync_times(self):
+        self._start_us = _as_us(self.start_time)
+        self._expiry_us = _as_us(self.expiry_time) if self.expiry_time else _INT64_MAX
+        self._frequency_us = int(self.reminder_frequency.total_seconds() * 1_000_000)
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        if now is None:
+            now = datetime.now()
+        return self.is_active_us(_as_us(now))
+
+    def is_active_us(self, now_us: int) -> bool:
+        return (self.status == AlertStatus.ACTIVE and
+                self._start_us <= now_us <= self._expiry_us)
+
+@dataclass(slots=True)
 class UserAlertState:
     user_id: str
     alert_id: str
@@ -74,23 +113,21 @@ class UserAlertState:
     last_reminder_sent: Optional[datetime] = None
     snoozed_until: Optional[datetime] = None
     read_at: Optional[datetime] = None
-    
-    def should_receive_reminder(self, alert: Alert) -> bool:
-        if self.status == NotificationStatus.SNOOZED:
-            if self.snoozed_until and datetime.now() > self.snoozed_until:
-                self.status = NotificationStatus.UNREAD
-                self.snoozed_until = None
-            else:
-                return False
-        
-        if self.status == NotificationStatus.READ:
-            return False
-            
-        if not self.last_reminder_sent:
-            return True
-            
-        time_since_last = datetime.now() - self.last_reminder_sent
-        return time_since_last >= alert.reminder_frequency
+    # Epoch-microsecond mirrors for the batch kernel; 0 means unset.
+    _last_reminder_us: int = field(default=0, init=False, repr=False)
+    _snoozed_until_us: int = field(default=0, init=False, repr=False)
+
+    def set_last_reminder_sent(self, now: datetime, now_us: Optional[int] = None):
+        self.last_reminder_sent = now
+        self._last_reminder_us = _as_us(now) if now_us is None else now_us
+
+    def should_receive_reminder(self, alert: Alert, now: Optional[datetime] = None) -> bool:
+        # Single-state convenience wrapper over the batch kernel, so the
+        # reminder rule lives in exactly one place.
+        if now is None:
+            now = datetime.now()
+        due, _, _ = _due_states([self], alert, _as_us(now))
+        return bool(due)
     
     def mark_read(self):
         self.status = NotificationStatus.READ
@@ -99,9 +136,54 @@ class UserAlertState:
     def snooze_until_tomorrow(self):
         tomorrow = datetime.now() + timedelta(days=1)
         self.snoozed_until = tomorrow.replace(hour=0, minute=0, second=0)
+        self._snoozed_until_us = _as_us(self.snoozed_until)
         self.status = NotificationStatus.SNOOZED
 
-@dataclass
+def _due_states(states: List[UserAlertState], alert: Alert, now_us: int) -> tuple:
+    """Batch form of should_receive_reminder over one alert's states.
+
+    Evaluates the whole batch in a single pass with the shared values
+    (status constants, the due-before threshold) hoisted out of the loop;
+    all time checks are epoch-microsecond integer compares. Returns
+    (due_states, lapsed_snoozes, next_us): lapsed_snoozes counts SNOOZED
+    states whose window ended and were reset to UNREAD, and next_us is the
+    earliest instant a currently not-due state could become due
+    (_INT64_MAX if none will).
+    """
+    read = NotificationStatus.READ
+    unread = NotificationStatus.UNREAD
+    frequency_us = alert._frequency_us
+    # last <= now - frequency  <=>  now - last >= frequency
+    due_before_us = now_us - frequency_us
+
+    due = []
+    due_append = due.append
+    lapsed = 0
+    next_us = _INT64_MAX
+    for state in states:
+        status = state.status
+        if status is not unread:
+            # UNREAD is the common case; READ and SNOOZED take the slow path.
+            if status is read:
+                continue
+            snoozed_until_us = state._snoozed_until_us
+            if snoozed_until_us and now_us > snoozed_until_us:
+                state.status = unread
+                state.snoozed_until = None
+                state._snoozed_until_us = 0
+                lapsed += 1
+            else:
+                if snoozed_until_us and snoozed_until_us < next_us:
+                    next_us = snoozed_until_us
+                continue
+        last_us = state._last_reminder_us
+        if not last_us or last_us <= due_before_us:
+            due_append(state)
+        elif last_us + frequency_us < next_us:
+            next_us = last_us + frequency_us
+    return due, lapsed, next_us
+
+@dataclass(slots=True)
 class AlertAnalytics:
     total_alerts: int
     active_alerts: int
@@ -110,6 +192,26 @@ class AlertAnalytics:
     delivery_stats: Dict[str, int]
 
 # ===== VISIBILITY CONFIGURATIONS =====
+class _AllUsers:
+    """Set-like view of every user in the repository.
+
+    Membership is O(1) and iteration reads the live user dict, so
+    organization-wide visibility never copies the full user-id set.
+    """
+    __slots__ = ('_user_repository',)
+
+    def __init__(self, user_repository: 'UserRepository'):
+        self._user_repository = user_repository
+
+    def __contains__(self, user_id) -> bool:
+        return True
+
+    def __iter__(self):
+        return iter(self._user_repository.users)
+
+    def __len__(self) -> int:
+        return len(self._user_repository.users)
+
 class VisibilityConfig(ABC):
     @abstractmethod
     def get_target_users(self, user_repository: 'UserRepository') -> Set[str]:
@@ -117,19 +219,26 @@ class VisibilityConfig(ABC):
 
 class OrganizationVisibility(VisibilityConfig):
     def get_target_users(self, user_repository: 'UserRepository') -> Set[str]:
-        return set(user_repository.get_all_user_ids())
+        return _AllUsers(user_repository)
+
+@functools.lru_cache(maxsize=1024)
+def _team_union(team_ids: frozenset, repo_version: int, user_repository: 'UserRepository') -> frozenset:
+    # repo_version is part of the key purely so a membership change in the
+    # repository invalidates previously cached unions.
+    target_users = set()
+    for team_id in team_ids:
+        team = user_repository.get_team(team_id)
+        if team:
+            target_users.update(team.member_ids)
+    return frozenset(target_users)
 
 class TeamVisibility(VisibilityConfig):
     def __init__(self, team_ids: Set[str]):
         self.team_ids = team_ids
-    
+        self._team_ids_key = frozenset(team_ids)
+
     def get_target_users(self, user_repository: 'UserRepository') -> Set[str]:
-        target_users = set()
-        for team_id in self.team_ids:
-            team = user_repository.get_team(team_id)
-            if team:
-                target_users.update(team.member_ids)
-        return target_users
+        return _team_union(self._team_ids_key, user_repository.version, user_repository)
 
 class UserVisibility(VisibilityConfig):
     def __init__(self, user_ids: Set[str]):
@@ -139,16 +248,19 @@ class UserVisibility(VisibilityConfig):
         return self.user_ids
 
 class VisibilityFactory:
+    _CONSTRUCTORS = {
+        "organization": lambda target_ids: OrganizationVisibility(),
+        "team": TeamVisibility,
+        "user": UserVisibility,
+    }
+
     @staticmethod
     def create_visibility(visibility_type: str, target_ids: Set[str]) -> VisibilityConfig:
-        if visibility_type == "organization":
-            return OrganizationVisibility()
-        elif visibility_type == "team":
-            return TeamVisibility(target_ids)
-        elif visibility_type == "user":
-            return UserVisibility(target_ids)
-        else:
-            raise ValueError(f"Unknown visibility type: {visibility_type}")
+        try:
+            constructor = VisibilityFactory._CONSTRUCTORS[visibility_type]
+        except KeyError:
+            raise ValueError(f"Unknown visibility type: {visibility_type}") from None
+        return constructor(target_ids)
 
 # ===== NOTIFICATION CHANNELS =====
 class NotificationChannel(ABC):
@@ -156,6 +268,11 @@ class NotificationChannel(ABC):
     def send(self, alert: Alert, user_id: str) -> bool:
         pass
 
+    async def send_async(self, alert: Alert, user_id: str) -> bool:
+        # Default bridge for blocking channels; channels backed by a native
+        # async client override this so sends can overlap on the event loop.
+        return await asyncio.to_thread(self.send, alert, user_id)
+
 class InAppChannel(NotificationChannel):
     def send(self, alert: Alert, user_id: str) -> bool:
         print(f"In-App notification sent to user {user_id}: {alert.title}")
@@ -166,22 +283,125 @@ class EmailChannel(NotificationChannel):
         print(f"Email sent to user {user_id}: {alert.title}")
         return True
 
+    async def send_async(self, alert: Alert, user_id: str) -> bool:
+        # A real implementation would await an async SMTP/HTTP client here,
+        # keeping many messages in flight per event-loop pass.
+        print(f"Email sent to user {user_id}: {alert.title}")
+        return True
+
 class NotificationDelivery:
     def __init__(self):
         self._channels = {
             DeliveryType.IN_APP: InAppChannel(),
             DeliveryType.EMAIL: EmailChannel()
         }
-    
+
     def deliver(self, alert: Alert, user_id: str) -> bool:
         channel = self._channels.get(alert.delivery_type)
         if channel:
             return channel.send(alert, user_id)
         return False
 
+    async def deliver_async(self, alert: Alert, user_id: str) -> bool:
+        channel = self._channels.get(alert.delivery_type)
+        if channel:
+            return await channel.send_async(alert, user_id)
+        return False
+
+    def deliver_batch(self, pairs: List[tuple]) -> List[bool]:
+        """Deliver (alert, user_id) pairs concurrently; returns per-pair success."""
+        async def run():
+            results = await asyncio.gather(
+                *(self.deliver_async(alert, user_id) for alert, user_id in pairs),
+                return_exceptions=True)
+            # One failing channel/receiver must not block the batch.
+            return [result is True for result in results]
+        return asyncio.run(run())
+
+class NotificationQueue:
+    """Background delivery queue decoupling enqueue from actual sends.
+
+    An in-process stand-in for a persistent broker (Redis/RabbitMQ): callers
+    enqueue (alert, user_id) and return immediately; a daemon worker drains
+    the queue in batches through NotificationDelivery. Failed sends are
+    retried with exponential backoff and dead-lettered after MAX_RETRIES.
+    """
+    BATCH_SIZE = 100
+    MAX_RETRIES = 3
+    BASE_RETRY_DELAY = 0.5  # seconds, doubled per attempt
+    # Bounded so a large reminder pass exerts backpressure on producers
+    # instead of growing the pending queue without limit.
+    MAX_PENDING = 10_000
+
+    def __init__(self, delivery: NotificationDelivery):
+        self.delivery = delivery
+        self.dead_letters: List[tuple] = []
+        self._queue: queue.Queue = queue.Queue(maxsize=self.MAX_PENDING)
+        self._worker_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        # Neither the worker thread nor the queue's internal locks survive
+        # fork, so under a pre-forking server (gunicorn --preload) the state
+        # inherited from the master is unusable: the thread is dead and the
+        # queue's condition still lists the parent's waiter. Detect the fork
+        # via pid and start this process over with a fresh queue and worker;
+        # any items seen in the inherited copy still belong to the parent.
+        if (self._pid == os.getpid() and
+                self._worker is not None and self._worker.is_alive()):
+            return
+        with self._worker_lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self.MAX_PENDING)
+                self._worker = None
+                self._pid = os.getpid()
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+    def enqueue(self, alert: Alert, user_id: str):
+        self._ensure_worker()
+        self._queue.put((alert, user_id, 0))
+
+    def join(self):
+        """Block until everything currently enqueued has been processed."""
+        self._ensure_worker()
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                results = self.delivery.deliver_batch(
+                    [(alert, user_id) for alert, user_id, _ in batch])
+                for (alert, user_id, attempts), delivered in zip(batch, results):
+                    if delivered:
+                        continue
+                    attempts += 1
+                    if attempts >= self.MAX_RETRIES:
+                        self.dead_letters.append((alert.id, user_id))
+                    else:
+                        delay = self.BASE_RETRY_DELAY * (2 ** (attempts - 1))
+                        threading.Timer(
+                            delay, self._queue.put, args=((alert, user_id, attempts),)
+                        ).start()
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
 # ===== REPOSITORY & MANAGEMENT =====
 class UserRepository:
     def __init__(self):
+        # Bumped on any user/team membership change so cached team unions
+        # and resolved alert targets are recomputed.
+        self.version = 0
         self.users = {
             "user1": User("user1", "Admin User", "admin@company.com", "team1"),
             "user2": User("user2", "Engineering User", "eng@company.com", "team1"),
@@ -205,6 +425,21 @@ class AlertManager:
     def __init__(self, user_repository: 'UserRepository'):
         self.alerts: Dict[str, Alert] = {}
         self.user_repository = user_repository
+        # Reverse index: user_id -> ids of alerts explicitly targeting that
+        # user. Organization-wide alerts are tracked separately so they never
+        # have to be expanded to every user id.
+        self._user_index: Dict[str, Set[str]] = {}
+        self._org_alert_ids: Set[str] = set()
+        # Alert ids bucketed by status, plus a min-heap of (expiry_time, id)
+        # so due expiries are promoted without scanning every alert. Heap
+        # entries are lazily discarded when an alert's expiry_time changes.
+        self._by_status: Dict[AlertStatus, Set[str]] = {status: set() for status in AlertStatus}
+        self._expiry_heap: List[tuple] = []
+        self._by_severity: Dict[Severity, Set[str]] = {severity: set() for severity in Severity}
+        self._user_index_repo_version = user_repository.version
+        # Bumped on any alert mutation; lets the reminder scheduler detect
+        # that nothing changed since its last pass.
+        self.mutation_count = 0
     
     def create_alert(self, title: str, message: str, severity: Severity, 
                     delivery_type: DeliveryType, created_by: str,
@@ -228,78 +463,262 @@ class AlertManager:
         )
         
         self.alerts[alert.id] = alert
+        self._index_alert(alert)
+        self._by_status[alert.status].add(alert.id)
+        self._by_severity[alert.severity].add(alert.id)
+        if alert.expiry_time:
+            heapq.heappush(self._expiry_heap, (alert.expiry_time, alert.id))
+        self.mutation_count += 1
         return alert
-    
+
+    def _set_status(self, alert: Alert, status: AlertStatus):
+        if status == alert.status:
+            return
+        self._by_status[alert.status].discard(alert.id)
+        alert.status = status
+        self._by_status[status].add(alert.id)
+
+    def _expire_due(self, now: Optional[datetime] = None):
+        if not self._expiry_heap:
+            return
+        if now is None:
+            now = datetime.now()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expiry_time, alert_id = heapq.heappop(self._expiry_heap)
+            alert = self.alerts.get(alert_id)
+            if alert is None or alert.expiry_time != expiry_time:
+                continue  # stale entry superseded by an expiry_time update
+            if alert.status == AlertStatus.ACTIVE:
+                self._set_status(alert, AlertStatus.EXPIRED)
+                self._unindex_alert(alert)
+
+    def _index_alert(self, alert: Alert):
+        if isinstance(alert.visibility_config, OrganizationVisibility):
+            self._org_alert_ids.add(alert.id)
+        else:
+            for user_id in self._resolve_targets(alert):
+                self._user_index.setdefault(user_id, set()).add(alert.id)
+
+    def _unindex_alert(self, alert: Alert):
+        if alert.id in self._org_alert_ids:
+            self._org_alert_ids.discard(alert.id)
+            return
+        for user_id in self._resolve_targets(alert):
+            user_alert_ids = self._user_index.get(user_id)
+            if user_alert_ids:
+                user_alert_ids.discard(alert.id)
+
     def update_alert(self, alert_id: str, **kwargs) -> Optional[Alert]:
         if alert_id not in self.alerts:
             return None
-        
+
         alert = self.alerts[alert_id]
+        reindex = 'visibility_config' in kwargs or 'status' in kwargs
+        if reindex:
+            self._unindex_alert(alert)
         for key, value in kwargs.items():
-            if hasattr(alert, key):
-                setattr(alert, key, value)
-        
+            if not hasattr(alert, key):
+                continue
+            if key == 'status':
+                self._set_status(alert, value)
+                continue
+            if key == 'severity':
+                self._by_severity[alert.severity].discard(alert.id)
+                self._by_severity[value].add(alert.id)
+            setattr(alert, key, value)
+            if key == 'visibility_config':
+                alert._visibility_version += 1
+            elif key in ('start_time', 'expiry_time', 'reminder_frequency'):
+                alert._sync_times()
+                if key == 'expiry_time' and value is not None:
+                    heapq.heappush(self._expiry_heap, (value, alert.id))
+        if reindex and alert.status == AlertStatus.ACTIVE:
+            self._index_alert(alert)
+        self.mutation_count += 1
+
         return alert
-    
+
     def archive_alert(self, alert_id: str) -> bool:
         if alert_id in self.alerts:
-            self.alerts[alert_id].status = AlertStatus.ARCHIVED
+            alert = self.alerts[alert_id]
+            self._set_status(alert, AlertStatus.ARCHIVED)
+            self._unindex_alert(alert)
+            self.mutation_count += 1
             return True
         return False
-    
-    def get_active_alerts(self) -> List[Alert]:
-        return [alert for alert in self.alerts.values() if alert.is_active()]
-    
+
+    def get_active_alerts(self, now: Optional[datetime] = None) -> List[Alert]:
+        if now is None:
+            now = datetime.now()
+        self._expire_due(now)
+        now_us = _as_us(now)
+        return [self.alerts[alert_id] for alert_id in self._by_status[AlertStatus.ACTIVE]
+                if self.alerts[alert_id].is_active_us(now_us)]
+
+    def _resolve_targets(self, alert: Alert):
+        if (alert._target_users_cache is None or
+                alert._cached_visibility_version != alert._visibility_version or
+                alert._cached_repo_version != self.user_repository.version):
+            targets = alert.visibility_config.get_target_users(self.user_repository)
+            if not isinstance(targets, (frozenset, _AllUsers)):
+                # The all-users view is already O(1) membership and tracks
+                # the live repository; only concrete sets get frozen.
+                targets = frozenset(targets)
+            alert._target_users_cache = targets
+            alert._cached_visibility_version = alert._visibility_version
+            alert._cached_repo_version = self.user_repository.version
+        return alert._target_users_cache
+
+    def list_alerts(self, severity: Optional[Severity] = None,
+                    status: Optional[AlertStatus] = None) -> List[Alert]:
+        self._expire_due()
+        if severity is not None and status is not None:
+            alert_ids = self._by_severity[severity] & self._by_status[status]
+        elif severity is not None:
+            alert_ids = self._by_severity[severity]
+        elif status is not None:
+            alert_ids = self._by_status[status]
+        else:
+            return list(self.alerts.values())
+        return [self.alerts[alert_id] for alert_id in alert_ids]
+
+    def _refresh_user_index(self):
+        # Team membership changes shift which users an alert targets, so a
+        # repository version bump invalidates the reverse index the same way
+        # it invalidates per-alert target caches; rebuild it lazily from the
+        # ACTIVE bucket on the next user lookup.
+        if self._user_index_repo_version == self.user_repository.version:
+            return
+        self._user_index.clear()
+        for alert_id in self._by_status[AlertStatus.ACTIVE]:
+            if alert_id not in self._org_alert_ids:
+                for user_id in self._resolve_targets(self.alerts[alert_id]):
+                    self._user_index.setdefault(user_id, set()).add(alert_id)
+        self._user_index_repo_version = self.user_repository.version
+
     def get_alerts_for_user(self, user_id: str) -> List[Alert]:
-        user_alerts = []
-        for alert in self.get_active_alerts():
-            target_users = alert.visibility_config.get_target_users(self.user_repository)
-            if user_id in target_users:
-                user_alerts.append(alert)
-        return user_alerts
+        self._refresh_user_index()
+        now_us = _as_us(datetime.now())
+        alert_ids = self._user_index.get(user_id, set()) | self._org_alert_ids
+        return [self.alerts[alert_id] for alert_id in alert_ids
+                if self.alerts[alert_id].is_active_us(now_us)]
 
 class UserAlertStateManager:
     def __init__(self):
         self.user_states: Dict[str, Dict[str, UserAlertState]] = {}
-    
+        # Earliest instant any reminder could next become due; 0 forces the
+        # next scheduler pass to do a full evaluation. Maintained by
+        # ReminderScheduler at the end of each pass.
+        self.next_due_us: int = 0
+        # Running counters kept in step with state creation and status
+        # transitions so analytics never has to walk every state.
+        self.total_states: int = 0
+        self.status_counts: Dict[NotificationStatus, int] = {
+            status: 0 for status in NotificationStatus}
+
     def get_state(self, user_id: str, alert_id: str) -> UserAlertState:
-        if user_id not in self.user_states:
-            self.user_states[user_id] = {}
-        if alert_id not in self.user_states[user_id]:
-            self.user_states[user_id][alert_id] = UserAlertState(
-                user_id=user_id, 
-                alert_id=alert_id, 
+        states = self.user_states.setdefault(user_id, {})
+        state = states.get(alert_id)
+        if state is None:
+            state = UserAlertState(
+                user_id=user_id,
+                alert_id=alert_id,
                 status=NotificationStatus.UNREAD
             )
-        return self.user_states[user_id][alert_id]
-    
+            states[alert_id] = state
+            self.total_states += 1
+            self.status_counts[NotificationStatus.UNREAD] += 1
+        return state
+
+    def bulk_get_states(self, user_ids, alert_id: str) -> List[UserAlertState]:
+        return [self.get_state(user_id, alert_id) for user_id in user_ids]
+
+    def record_status_change(self, old_status: NotificationStatus, new_status: NotificationStatus, count: int = 1):
+        if old_status != new_status:
+            self.status_counts[old_status] -= count
+            self.status_counts[new_status] += count
+
     def update_state(self, state: UserAlertState):
-        if state.user_id not in self.user_states:
-            self.user_states[state.user_id] = {}
-        self.user_states[state.user_id][state.alert_id] = state
+        states = self.user_states.setdefault(state.user_id, {})
+        if state.alert_id not in states:
+            self.total_states += 1
+            self.status_counts[state.status] += 1
+        states[state.alert_id] = state
 
 class ReminderScheduler:
-    def __init__(self, alert_manager: AlertManager, delivery: NotificationDelivery, state_manager: UserAlertStateManager):
+    def __init__(self, alert_manager: AlertManager, notification_queue: NotificationQueue, state_manager: UserAlertStateManager):
         self.alert_manager = alert_manager
-        self.delivery = delivery
+        self.notification_queue = notification_queue
         self.state_manager = state_manager
-    
-    def process_reminders(self):
-        active_alerts = self.alert_manager.get_active_alerts()
-        
-        for alert in active_alerts:
+        # (alert mutation_count, repo version) as of the last full pass;
+        # while unchanged, passes before next_due_us can be skipped outright.
+        self._last_signature = None
+        self._pass_next_due_us = _INT64_MAX
+
+    STATE_CHUNK_SIZE = 1000
+
+    def _deliverables(self, now: datetime, now_us: int):
+        """Yield due (alert, user_state) pairs, one state chunk at a time.
+
+        Target users are consumed in STATE_CHUNK_SIZE slices so a pass over
+        an organization-wide alert never materializes more than one chunk of
+        states at once.
+        """
+        for alert in self.alert_manager.get_active_alerts(now):
             if not alert.reminders_enabled:
                 continue
-                
-            target_users = alert.visibility_config.get_target_users(self.alert_manager.user_repository)
-            
-            for user_id in target_users:
-                user_state = self.state_manager.get_state(user_id, alert.id)
-                
-                if user_state.should_receive_reminder(alert):
-                    if self.delivery.deliver(alert, user_id):
-                        user_state.last_reminder_sent = datetime.now()
-                        self.state_manager.update_state(user_state)
+
+            user_iter = iter(self.alert_manager._resolve_targets(alert))
+            while True:
+                chunk = list(itertools.islice(user_iter, self.STATE_CHUNK_SIZE))
+                if not chunk:
+                    break
+                states = self.state_manager.bulk_get_states(chunk, alert.id)
+                due, lapsed, next_us = _due_states(states, alert, now_us)
+                if lapsed:
+                    self.state_manager.record_status_change(
+                        NotificationStatus.SNOOZED, NotificationStatus.UNREAD, lapsed)
+                if next_us < self._pass_next_due_us:
+                    self._pass_next_due_us = next_us
+                yield from ((alert, user_state) for user_state in due)
+
+    def process_reminders(self):
+        # One clock read per pass; every activity/frequency check below
+        # compares against the same instant.
+        now = datetime.now()
+        now_us = _as_us(now)
+
+        # Idle short-circuit: if no alert/repository mutation happened since
+        # the last pass and nothing can be due yet, skip the whole sweep.
+        signature = (self.alert_manager.mutation_count,
+                     self.alert_manager.user_repository.version)
+        if signature == self._last_signature and now_us < self.state_manager.next_due_us:
+            return
+
+        # Mark at enqueue time so the next pass does not re-enqueue the same
+        # reminders while the worker is still draining; failed sends are
+        # retried (and eventually dead-lettered) by the queue itself.
+        # get_state hands back the live stored object, so mutating
+        # last_reminder_sent is already visible in the store; no write-back.
+        # The bounded queue applies backpressure, keeping peak memory at
+        # O(chunk + queue bound) rather than O(alerts x users).
+        self._pass_next_due_us = _INT64_MAX
+        for alert, user_state in self._deliverables(now, now_us):
+            self.notification_queue.enqueue(alert, user_state.user_id)
+            user_state.set_last_reminder_sent(now, now_us)
+            next_us = now_us + alert._frequency_us
+            if next_us < self._pass_next_due_us:
+                self._pass_next_due_us = next_us
+
+        # Alerts that have not started yet begin generating work at start_time.
+        alerts = self.alert_manager.alerts
+        for alert_id in self.alert_manager._by_status[AlertStatus.ACTIVE]:
+            alert = alerts[alert_id]
+            if alert.reminders_enabled and now_us < alert._start_us < self._pass_next_due_us:
+                self._pass_next_due_us = alert._start_us
+
+        self.state_manager.next_due_us = self._pass_next_due_us
+        self._last_signature = signature
 
 class AnalyticsEngine:
     def __init__(self, alert_manager: AlertManager, state_manager: UserAlertStateManager):
@@ -307,34 +726,18 @@ class AnalyticsEngine:
         self.state_manager = state_manager
     
     def get_system_analytics(self) -> AlertAnalytics:
-        alerts = list(self.alert_manager.alerts.values())
         active_alerts = self.alert_manager.get_active_alerts()
-        
-        severity_counts = {severity: 0 for severity in Severity}
-        for alert in alerts:
-            severity_counts[alert.severity] += 1
-        
-        delivered = 0
-        read = 0
-        snoozed = 0
-        
-        for user_states in self.state_manager.user_states.values():
-            for state in user_states.values():
-                delivered += 1
-                if state.status == NotificationStatus.READ:
-                    read += 1
-                elif state.status == NotificationStatus.SNOOZED:
-                    snoozed += 1
-        
+
         return AlertAnalytics(
-            total_alerts=len(alerts),
+            total_alerts=len(self.alert_manager.alerts),
             active_alerts=len(active_alerts),
-            expired_alerts=len([a for a in alerts if a.status == AlertStatus.EXPIRED]),
-            alerts_by_severity=severity_counts,
+            expired_alerts=len(self.alert_manager._by_status[AlertStatus.EXPIRED]),
+            alerts_by_severity={severity: len(alert_ids) for severity, alert_ids
+                                in self.alert_manager._by_severity.items()},
             delivery_stats={
-                "delivered": delivered,
-                "read": read,
-                "snoozed": snoozed
+                "delivered": self.state_manager.total_states,
+                "read": self.state_manager.status_counts[NotificationStatus.READ],
+                "snoozed": self.state_manager.status_counts[NotificationStatus.SNOOZED]
             }
         )
 
@@ -344,8 +747,9 @@ class AlertingSystem:
         self.user_repository = UserRepository()
         self.alert_manager = AlertManager(self.user_repository)
         self.delivery = NotificationDelivery()
+        self.notification_queue = NotificationQueue(self.delivery)
         self.state_manager = UserAlertStateManager()
-        self.scheduler = ReminderScheduler(self.alert_manager, self.delivery, self.state_manager)
+        self.scheduler = ReminderScheduler(self.alert_manager, self.notification_queue, self.state_manager)
         self.analytics = AnalyticsEngine(self.alert_manager, self.state_manager)
     
     def create_alert(self, title: str, message: str, severity: Severity, 
@@ -363,31 +767,35 @@ class AlertingSystem:
         )
     
     def list_alerts(self, filters: Optional[Dict] = None) -> List[Alert]:
-        alerts = list(self.alert_manager.alerts.values())
-        if filters:
-            filtered_alerts = []
-            for alert in alerts:
-                matches = True
-                if 'severity' in filters and alert.severity != filters['severity']:
-                    matches = False
-                if 'status' in filters and alert.status.value != filters['status']:
-                    matches = False
-                if matches:
-                    filtered_alerts.append(alert)
-            return filtered_alerts
-        return alerts
+        filters = filters or {}
+        status = filters.get('status')
+        if status is not None and not isinstance(status, AlertStatus):
+            status = AlertStatus(status)
+        return self.alert_manager.list_alerts(
+            severity=filters.get('severity'), status=status)
     
     def get_user_alerts(self, user_id: str) -> List[Alert]:
         return self.alert_manager.get_alerts_for_user(user_id)
     
     def snooze_alert(self, user_id: str, alert_id: str):
         state = self.state_manager.get_state(user_id, alert_id)
+        prev_status = state.status
         state.snooze_until_tomorrow()
+        self.state_manager.record_status_change(prev_status, state.status)
+        # A snooze can move this state's earliest-due instant below the
+        # scheduler's stored watermark (e.g. snoozing a READ state revives it
+        # at the window's end); lower the watermark so the idle short-circuit
+        # does not skip the lapse. mark_read only removes work, so it needs
+        # no equivalent.
+        self.state_manager.next_due_us = min(
+            self.state_manager.next_due_us, state._snoozed_until_us)
         self.state_manager.update_state(state)
-    
+
     def mark_alert_read(self, user_id: str, alert_id: str):
         state = self.state_manager.get_state(user_id, alert_id)
+        prev_status = state.status
         state.mark_read()
+        self.state_manager.record_status_change(prev_status, state.status)
         self.state_manager.update_state(state)
     
     def process_reminders(self):
@@ -397,16 +805,87 @@ class AlertingSystem:
         return self.analytics.get_system_analytics()
 
 # ===== FLASK WEB SERVER =====
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
+@dataclass(slots=True)
+class AlertResponse:
+    """Wire shape of an alert as returned by the admin endpoints."""
+    id: str
+    title: str
+    message: str
+    severity: str
+    status: str
+    start_time: datetime
+    expiry_time: Optional[datetime]
+    created_by: str
+    reminders_enabled: bool
+
+    @classmethod
+    def from_alert(cls, alert: Alert) -> 'AlertResponse':
+        return cls(
+            id=alert.id,
+            title=alert.title,
+            message=alert.message,
+            severity=alert.severity.value,
+            status=alert.status.value,
+            start_time=alert.start_time,
+            expiry_time=alert.expiry_time,
+            created_by=alert.created_by,
+            reminders_enabled=alert.reminders_enabled
+        )
+
+@dataclass(slots=True)
+class UserAlertResponse:
+    """Wire shape of an alert paired with the requesting user's state."""
+    id: str
+    title: str
+    message: str
+    severity: str
+    user_status: str
+    snoozed_until: Optional[datetime]
+    read_at: Optional[datetime]
+    created_at: datetime
+
+    @classmethod
+    def from_state(cls, alert: Alert, state: UserAlertState) -> 'UserAlertResponse':
+        return cls(
+            id=alert.id,
+            title=alert.title,
+            message=alert.message,
+            severity=alert.severity.value,
+            user_status=state.status.value,
+            snoozed_until=state.snoozed_until,
+            read_at=state.read_at,
+            created_at=alert.start_time
+        )
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson when available, stdlib json otherwise.
+
+    Serializes datetime as ISO 8601, Enum as its value, and dataclass
+    response models directly (orjson does dataclasses natively), so
+    endpoints can hand domain and response types straight to jsonify.
+    """
+    @staticmethod
+    def _default(obj):
         if isinstance(obj, datetime):
             return obj.isoformat()
         if isinstance(obj, Enum):
             return obj.value
-        return super().default(obj)
+        if is_dataclass(obj):
+            return asdict(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is not None:
+            return orjson.dumps(obj, default=self._default).decode()
+        return json.dumps(obj, default=self._default, ensure_ascii=False)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None:
+            return orjson.loads(s)
+        return json.loads(s)
 
 app = Flask(__name__)
-app.json_encoder = DateTimeEncoder
+app.json = FastJSONProvider(app)
 system = AlertingSystem()
 
 @app.route('/admin/alerts', methods=['POST'])
@@ -454,18 +933,8 @@ def list_alerts():
             filters['status'] = request.args.get('status')
         
         alerts = system.list_alerts(filters)
-        
-        return jsonify([{
-            'id': alert.id,
-            'title': alert.title,
-            'message': alert.message,
-            'severity': alert.severity.value,
-            'status': alert.status.value,
-            'start_time': alert.start_time,
-            'expiry_time': alert.expiry_time,
-            'created_by': alert.created_by,
-            'reminders_enabled': alert.reminders_enabled
-        } for alert in alerts])
+
+        return jsonify([AlertResponse.from_alert(alert) for alert in alerts])
         
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -519,22 +988,11 @@ def archive_alert(alert_id):
 def get_user_alerts(user_id):
     try:
         alerts = system.get_user_alerts(user_id)
-        
-        alert_list = []
-        for alert in alerts:
-            state = system.state_manager.get_state(user_id, alert.id)
-            alert_list.append({
-                'id': alert.id,
-                'title': alert.title,
-                'message': alert.message,
-                'severity': alert.severity.value,
-                'user_status': state.status.value,
-                'snoozed_until': state.snoozed_until,
-                'read_at': state.read_at,
-                'created_at': alert.start_time
-            })
-        
-        return jsonify(alert_list)
+
+        return jsonify([
+            UserAlertResponse.from_state(alert, system.state_manager.get_state(user_id, alert.id))
+            for alert in alerts
+        ])
         
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -578,7 +1036,7 @@ def get_analytics():
 def process_reminders():
     try:
         system.process_reminders()
-        return jsonify({'message': 'Reminders processed successfully'})
+        return jsonify({'message': 'Reminders enqueued for delivery'}), 202
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -587,7 +1045,11 @@ def health_check():
     return jsonify({'status': 'healthy', 'timestamp': datetime.now()})
 
 if __name__ == '__main__':
-    print("Starting Alerting System Server on http://localhost:5000")
+    print("Starting Alerting System Server (dev mode) on http://localhost:5000")
+    print("For production, run under a WSGI server, e.g.:")
+    print("  gunicorn -w 1 -k gthread --threads 16 -b 0.0.0.0:5000 alerting:app")
+    print("(single worker: the store is in-process memory; use more workers"
+          " only once state lives in a shared database/broker)")
     print("Available endpoints:")
     print("  POST   /admin/alerts")
     print("  GET    /admin/alerts")
@@ -599,4 +1061,4 @@ if __name__ == '__main__':
     print("  GET    /analytics")
     print("  POST   /system/process-reminders")
     print("  GET    /health")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(host='0.0.0.0', port=5000)